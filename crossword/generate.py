@@ -1,5 +1,8 @@
+import operator
 import sys
 
+from collections import deque
+
 from crossword import *
 
 
@@ -14,6 +17,32 @@ class CrosswordCreator():
             var: self.crossword.words.copy()
             for var in self.crossword.variables
         }
+        # Letter index per variable, built lazily by get_letter_index
+        self.letter_index = dict()
+        # Cache neighbors and overlaps once; these never change and the
+        # lookups sit inside every hot loop of the search
+        self.neighbors = {
+            var: frozenset(self.crossword.neighbors(var))
+            for var in self.domains
+        }
+        self.overlaps = dict(self.crossword.overlaps)
+        # Words used by the current partial assignment in backtrack
+        self.used_words = set()
+
+    def get_letter_index(self, var):
+        """
+        Return a list mapping each position of `var` to a dict of
+        letter -> set of words in `self.domains[var]` with that letter at
+        that position. Entries are built lazily and must be invalidated
+        (popped from `self.letter_index`) whenever the domain changes.
+        """
+        if var not in self.letter_index:
+            index = [dict() for _ in range(var.length)]
+            for word in self.domains[var]:
+                for k in range(var.length):
+                    index[k].setdefault(word[k], set()).add(word)
+            self.letter_index[var] = index
+        return self.letter_index[var]
 
     def letter_grid(self, assignment):
         """
@@ -101,13 +130,14 @@ class CrosswordCreator():
         """
         # Loop through variables
         for var in self.domains:
-            # Make a copy to resolve a "RuntimeError"
-            domain_copy = self.domains[var].copy()
-            # Loop through variable values
-            for word in domain_copy:
-                # Check unary constraint and act
-                if len(word) != var.length:
-                    self.domains[var].remove(word)
+            # Keep only the words satisfying the unary length constraint,
+            # in one pass with no intermediate copy
+            self.domains[var] = {
+                word for word in self.domains[var]
+                if len(word) == var.length
+            }
+            # Domain changed, so any letter index for it is stale
+            self.letter_index.pop(var, None)
 
     def revise(self, x, y):
         """
@@ -119,25 +149,26 @@ class CrosswordCreator():
         False if no revision was made.
         """
         revised = False
-        x_domain_copy = self.domains[x].copy()
-        overlap = self.crossword.overlaps[x, y]
+        overlap = self.overlaps[x, y]
 
         if overlap is not None:
             i, j = overlap
-            
-            # Loop through all the words in X domain
-            for Xword in x_domain_copy:
-                valid = False
-                # Loop through all the words in Y domain
-                for Yword in self.domains[y]:
-                    # Check for binary constraints and if so remove word from X domain 
-                    if Xword[i] == Yword[j]:
-                        valid = True
-                        break
-                if not valid:
-                    self.domains[x].remove(Xword)
-                    revised = True
-                    
+            # Words in Y domain bucketed by their letter at position j
+            support = self.get_letter_index(y)[j]
+
+            # Keep the words in X domain with binary constraint support,
+            # checked with a single lookup each
+            new_domain = {
+                Xword for Xword in self.domains[x]
+                if support.get(Xword[i])
+            }
+
+            # Invalidate the letter index for x if its domain shrank
+            if len(new_domain) < len(self.domains[x]):
+                self.domains[x] = new_domain
+                self.letter_index.pop(x, None)
+                revised = True
+
         return revised
 
     def ac3(self, arcs=None):
@@ -149,27 +180,34 @@ class CrosswordCreator():
         Return True if arc consistency is enforced and no domains are empty;
         return False if one or more domains end up empty.
         """
-        # Check if arcs empty and if so initialize all arcs
+        # Check if arcs empty and if so initialize all overlapping arcs
         if arcs is None:
-            queue = []
+            queue = deque()
             for v1 in self.domains:
                 for v2 in self.domains:
-                    if v1 != v2:
+                    if v1 != v2 and self.overlaps[v1, v2] is not None:
                         queue.append((v1, v2))
         else:
-            queue = arcs
+            queue = deque(arcs)
+
+        # Track pending arcs so duplicates are not enqueued twice
+        in_queue = set(queue)
 
         # Loop through all arcs revising arc consistency
         while queue:
-            x, y = queue.pop(0)
+            arc = queue.popleft()
+            in_queue.discard(arc)
+            x, y = arc
             # If arc was revised
             if self.revise(x, y):
                 # Check if domain non-empty
                 if not self.domains[x]:
                     return False
                 # Add new values to check arc consistency
-                for z in self.crossword.neighbors(x) - {y}:
-                    queue.append((z, x))
+                for z in self.neighbors[x] - {y}:
+                    if (z, x) not in in_queue:
+                        queue.append((z, x))
+                        in_queue.add((z, x))
         return True
 
     def assignment_complete(self, assignment):
@@ -187,28 +225,24 @@ class CrosswordCreator():
         Return True if `assignment` is consistent (i.e., words fit in crossword
         puzzle without conflicting characters); return False otherwise.
         """
-        distinct_values = []
+        distinct_values = set()
 
         for var in assignment:
             val = assignment[var]
             # Check for length
             if len(val) != var.length:
                 return False
-            
-            # Check neighbor conflicts
-            for y in self.crossword.neighbors(var):
-                if y in assignment:
-                    if self.crossword.overlaps[var, y] is None:
-                        continue
-                    else:
-                        i, j = self.crossword.overlaps[var, y]
-                        if val[i] != assignment[y][j]:
-                            return False
-                    
+
+            # Check neighbor conflicts among assigned neighbors only
+            for y in self.neighbors[var] & assignment.keys():
+                i, j = self.overlaps[var, y]
+                if val[i] != assignment[y][j]:
+                    return False
+
             # Check uniqueness
             if val in distinct_values:
                 return False
-            distinct_values.append(val)
+            distinct_values.add(val)
         return True
 
     def order_domain_values(self, var, assignment):
@@ -219,23 +253,28 @@ class CrosswordCreator():
         that rules out the fewest values among the neighbors of `var`.
         """
         Dvalues = []
-        neighbors = self.crossword.neighbors(var)
+
+        # Cache each unassigned neighbor's overlap data and letter buckets
+        neighbors = []
+        for neighbor in self.neighbors[var]:
+            if neighbor in assignment:
+                continue
+            i, j = self.overlaps[var, neighbor]
+            neighbors.append(
+                (i, len(self.domains[neighbor]), self.get_letter_index(neighbor)[j])
+            )
 
         # Loop through the words in variable's domain
         for x in self.domains[var]:
-            if x in assignment:
-                continue
-            # Initialize "ruled out" counter
+            # Count neighbor values ruled out by the overlap letter
             c = 0
-            # Loop through var neighbors
-            for neighbor in neighbors:
-                if x in self.domains[neighbor]:
-                    c += 1
+            for i, size, support in neighbors:
+                c += size - len(support.get(x[i], ()))
             Dvalues.append((x, c))
 
-        s = sorted(Dvalues, key=lambda x: x[1])
+        Dvalues.sort(key=operator.itemgetter(1))
 
-        return [x[0] for x in s]
+        return [x[0] for x in Dvalues]
 
     def select_unassigned_variable(self, assignment):
         """
@@ -252,7 +291,7 @@ class CrosswordCreator():
                 continue
             # Get mrv and highest degree
             Dsize = len(self.domains[var])
-            Nsize = len(self.crossword.neighbors(var))
+            Nsize = len(self.neighbors[var])
             mrv.append((var, Dsize, Nsize))
 
         s = sorted(mrv, key=lambda x: (x[1], x[2]))
@@ -272,11 +311,43 @@ class CrosswordCreator():
             return assignment
         var = self.select_unassigned_variable(assignment)
         for val in self.order_domain_values(var, assignment):
+            # Uniqueness is the one constraint forward checking misses
+            if val in self.used_words:
+                continue
             assignment[var] = val
-            if self.consistent(assignment):
+            self.used_words.add(val)
+
+            # Snapshot domains so pruning can be rolled back
+            snapshot = {v: set(d) for v, d in self.domains.items()}
+            self.domains[var] = {val}
+            self.letter_index.pop(var, None)
+
+            # Forward check: restrict each neighbor to words supported by
+            # the chosen value through the overlap letter
+            failed = False
+            arcs = []
+            for n in self.neighbors[var]:
+                i, j = self.overlaps[var, n]
+                support = self.get_letter_index(n)[j].get(val[i], set())
+                new_domain = self.domains[n] & support
+                if not new_domain:
+                    failed = True
+                    break
+                if len(new_domain) < len(self.domains[n]):
+                    self.domains[n] = new_domain
+                    self.letter_index.pop(n, None)
+                    arcs.extend((z, n) for z in self.neighbors[n] if z != var)
+
+            # Propagate the pruning with AC-3, then recurse
+            if not failed and self.ac3(arcs=arcs):
                 result = self.backtrack(assignment)
                 if result:
                     return result
+
+            # Restore domains pruned during this branch
+            self.domains = snapshot
+            self.letter_index.clear()
+            self.used_words.remove(val)
             assignment.pop(var)
 
         return None
@@ -1,7 +1,12 @@
 import csv
 import itertools
+import math
 import sys
 
+import numpy as np
+
+from numba import njit
+
 PROBS = {
 
     # Unconditional probabilities for having gene
@@ -60,26 +65,79 @@ def main():
         for person in people
     }
 
+    # Precompute integer-indexed arrays for the compiled kernel
+    names = list(people)
+    indices = {name: i for i, name in enumerate(names)}
+    mother_idx = np.array([
+        indices[people[name]["mother"]] if people[name]["mother"] else -1
+        for name in names
+    ], dtype=np.int64)
+    father_idx = np.array([
+        indices[people[name]["father"]] if people[name]["father"] else -1
+        for name in names
+    ], dtype=np.int64)
+    # Precompute every person's factor for each (own, mother, father,
+    # trait) combination — only 3*3*3*2 distinct values per person
+    factor_table = np.empty((len(names), 3, 3, 3, 2))
+    for i, name in enumerate(names):
+        has_parents = (people[name]["mother"] is not None and
+                       people[name]["father"] is not None)
+        for g in range(3):
+            for mg in range(3):
+                for fg in range(3):
+                    if has_parents:
+                        mProb = get_prob(mg)
+                        fProb = get_prob(fg)
+                        if g == 1:
+                            formula = fProb * (1 - mProb) + mProb * (1 - fProb)
+                        elif g == 2:
+                            formula = mProb * fProb
+                        else:
+                            formula = (1 - mProb) * (1 - fProb)
+                    else:
+                        formula = PROBS["gene"][g]
+                    for trait in (False, True):
+                        factor_table[i, g, mg, fg, int(trait)] = (
+                            formula * PROBS["trait"][g][trait]
+                        )
+
+    # Accumulate the joint probabilities into arrays, one row per person
+    person_idx = np.arange(len(names))
+    gene_totals = np.zeros((len(names), 3))
+    trait_totals = np.zeros((len(names), 2))
+
+    # People with known trait status are forced by the evidence, so only
+    # the unknown ones need enumerating
+    unknowns = [name for name in names if people[name]["trait"] is None]
+    forced_true = {name for name in names if people[name]["trait"] is True}
+
     # Loop over all sets of people who might have the trait
-    names = set(people)
-    for have_trait in powerset(names):
-
-        # Check if current set of people violates known information
-        fails_evidence = any(
-            (people[person]["trait"] is not None and
-             people[person]["trait"] != (person in have_trait))
-            for person in names
-        )
-        if fails_evidence:
-            continue
+    for subset in itertools.product((False, True), repeat=len(unknowns)):
+        have_trait = forced_true | {
+            unknowns[i] for i, has in enumerate(subset) if has
+        }
+
+        # Trait membership as a mask, reused across gene assignments
+        trait_mask = np.array([name in have_trait for name in names])
+        trait_state = trait_mask.astype(np.int64)
 
-        # Loop over all sets of people who might have the gene
-        for one_gene in powerset(names):
-            for two_genes in powerset(names - one_gene):
+        # Loop over all gene assignments, one 0/1/2 state per person
+        for gene_state in itertools.product((0, 1, 2), repeat=len(names)):
+            gene_arr = np.array(gene_state, dtype=np.int64)
 
-                # Update probabilities with new joint probability
-                p = joint_probability(people, one_gene, two_genes, have_trait)
-                update(probabilities, one_gene, two_genes, have_trait, p)
+            # Add the new joint probability to every person's totals
+            p = joint_probability_fast(
+                gene_arr, trait_state, mother_idx, father_idx, factor_table
+            )
+            np.add.at(gene_totals, (person_idx, gene_arr), p)
+            np.add.at(trait_totals, (person_idx, trait_state), p)
+
+    # Copy the accumulated totals into the per-person distributions
+    for i, person in enumerate(names):
+        for gene in range(3):
+            probabilities[person]["gene"][gene] = gene_totals[i, gene]
+        probabilities[person]["trait"][True] = trait_totals[i, 1]
+        probabilities[person]["trait"][False] = trait_totals[i, 0]
 
     # Ensure probabilities sum to 1
     normalize(probabilities)
@@ -118,14 +176,14 @@ def load_data(filename):
 
 def powerset(s):
     """
-    Return a list of all possible subsets of set s.
+    Return an iterator over all possible subsets of set s.
     """
     s = list(s)
-    return [
-        set(s) for s in itertools.chain.from_iterable(
+    return (
+        set(subset) for subset in itertools.chain.from_iterable(
             itertools.combinations(s, r) for r in range(len(s) + 1)
         )
-    ]
+    )
 
 
 def joint_probability(people, one_gene, two_genes, have_trait):
@@ -139,51 +197,68 @@ def joint_probability(people, one_gene, two_genes, have_trait):
         * everyone in set `have_trait` has the trait, and
         * everyone not in set` have_trait` does not have the trait.
     """
+    # Bind the probability tables to locals once, outside the loop
+    gene_probs = PROBS["gene"]
+    trait_probs = PROBS["trait"]
+
     # Initialize jointProb list
     jointProb = []
 
-    for person in people:
+    for person, info in people.items():
+        # Get person's gene count with helper funciton
+        cgc = gene_count(person, one_gene, two_genes)
+
         # Run loop for child
-        if people[person]["mother"] is not None and people[person]["father"] is not None:
+        if info["mother"] is not None and info["father"] is not None:
 
-            # Get gene counts and parent probability with helper funcitons
-            cgc = gene_count(people[person]["name"], one_gene, two_genes)
-            mProb = get_prob(gene_count(people[person]["mother"], one_gene, two_genes))
-            fProb = get_prob(gene_count(people[person]["father"], one_gene, two_genes))
-        
-            if people[person]["name"] in one_gene:
-                # Case 1: One from m and none from f             
+            # Get parent probabilities with helper funcitons
+            mProb = get_prob(gene_count(info["mother"], one_gene, two_genes))
+            fProb = get_prob(gene_count(info["father"], one_gene, two_genes))
+
+            if cgc == 1:
+                # Case 1: One from m and none from f
                 # Case 2: One from f and none from m
                 # Add the cases
                 formula = fProb * (1 - mProb) + mProb * (1 - fProb)
-            elif people[person]["name"] in two_genes:
+            elif cgc == 2:
                 # One from m and one from f
                 formula = mProb * fProb
             else:
                 # None from m and none from f
                 formula = (1 - mProb) * (1 - fProb)
 
-            # Considering "the trait"
-            if people[person]["name"] in have_trait:
-                jointProb.append(formula * PROBS["trait"][cgc][True])
-            else:
-                jointProb.append(formula * PROBS["trait"][cgc][False])
-
         # Run loop for parents
         else:
-            # Get person's gene count
-            pgc = gene_count(people[person]["name"],one_gene, two_genes)
+            formula = gene_probs[cgc]
+
+        # Considering "the trait"
+        jointProb.append(formula * trait_probs[cgc][person in have_trait])
+
+    # Multiply every value in joint probabilities together
+    return math.prod(jointProb)
+
+
+@njit(cache=True)
+def joint_probability_fast(gene_state, trait_state, mother_idx, father_idx,
+                           factor_table):
+    """
+    Compiled counterpart of `joint_probability` operating on
+    integer-indexed arrays: `gene_state[i]` is person i's gene count,
+    `trait_state[i]` whether they have the trait (0/1), and `mother_idx`
+    / `father_idx` hold parent indices (-1 for no parent). Each person's
+    factor is a single lookup in the precomputed `factor_table`, indexed
+    by (person, own genes, mother's genes, father's genes, trait); for
+    founders the parent axes are constant, so index 0 is used.
+    """
+    jp = 1.0
+
+    for i in range(gene_state.shape[0]):
+        m = mother_idx[i]
+        f = father_idx[i]
+        mg = gene_state[m] if m >= 0 else 0
+        fg = gene_state[f] if f >= 0 else 0
+        jp *= factor_table[i, gene_state[i], mg, fg, trait_state[i]]
 
-            # Considering "the trait"
-            if people[person]["name"] in have_trait:
-                jointProb.append(PROBS["gene"][pgc] * PROBS["trait"][pgc][True])
-            else:
-                jointProb.append(PROBS["gene"][pgc] * PROBS["trait"][pgc][False])
-    
-    # Multiply every value in joint probabiliyties dictinairy
-    jp = 1
-    for val in jointProb:
-        jp *= val
     return jp
 
 
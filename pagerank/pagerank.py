@@ -3,9 +3,14 @@ import random
 import re
 import sys
 
+import numpy as np
+
 DAMPING = 0.85
 SAMPLES = 10000
 
+# Compile the link pattern once for all crawled files
+HREF_RE = re.compile(r"<a\s+(?:[^>]*?)href=\"([^\"]*)\"")
+
 
 def main():
     if len(sys.argv) != 2:
@@ -33,9 +38,10 @@ def crawl(directory):
     for filename in os.listdir(directory):
         if not filename.endswith(".html"):
             continue
-        with open(os.path.join(directory, filename)) as f:
+        path = os.path.join(directory, filename)
+        with open(path, encoding="utf-8", errors="ignore") as f:
             contents = f.read()
-            links = re.findall(r"<a\s+(?:[^>]*?)href=\"([^\"]*)\"", contents)
+            links = HREF_RE.findall(contents)
             pages[filename] = set(links) - {filename}
 
     # Only include links to other pages in the corpus
@@ -88,25 +94,31 @@ def sample_pagerank(corpus, damping_factor, n):
     their estimated PageRank value (a value between 0 and 1). All
     PageRank values should sum to 1.
     """
-    # Initialize data structures
-    pages_ranked = {}
+    # Precompute each page's candidates and cumulative weights once,
+    # instead of rebuilding the transition model on every sample
     pages = list(corpus.keys())
+    candidates = {}
+    cumulative = {}
+    for page in pages:
+        distribution = transition_model(corpus, page, damping_factor)
+        candidates[page] = list(distribution.keys())
+        weights = np.cumsum(list(distribution.values()))
+        cumulative[page] = weights / weights[-1]
 
-    # First random sample probabilities
-    r_page = random.choice(pages)
-    curr_prob = transition_model(corpus, r_page, damping_factor)
+    # Initialize sample counts
+    counts = {page: 0 for page in pages}
 
-    # Initialize probability values
-    for page in pages:
-        pages_ranked[page] = 0.0
-    pages_ranked[r_page] += 1/n
+    # First random sample
+    sample = random.choice(pages)
+    counts[sample] += 1
 
-    for _ in range(n-1):
-        next_sample_page = random.choices(list(curr_prob.keys()), weights=list(curr_prob.values()))[0]
-        pages_ranked[next_sample_page] += 1/n
-        curr_prob = transition_model(corpus, next_sample_page, damping_factor)
-        
-    return pages_ranked
+    # Draw each next sample with a single binary search
+    for _ in range(n - 1):
+        idx = cumulative[sample].searchsorted(random.random())
+        sample = candidates[sample][idx]
+        counts[sample] += 1
+
+    return {page: count / n for page, count in counts.items()}
 
 
 def iterate_pagerank(corpus, damping_factor):
@@ -118,45 +130,33 @@ def iterate_pagerank(corpus, damping_factor):
     their estimated PageRank value (a value between 0 and 1). All
     PageRank values should sum to 1.
     """
-    # Initialize data structures
-    pages_ranked = {}
+    # Index pages and build the column-stochastic transition matrix
     pages = list(corpus.keys())
+    indices = {page: i for i, page in enumerate(pages)}
+    N = len(pages)
+
+    M = np.zeros((N, N))
+    for page, links in corpus.items():
+        j = indices[page]
+        # Check if any page has no outgoing links, if so add one link for every page in pages
+        if len(links) == 0:
+            M[:, j] = 1 / N
+        else:
+            for link in links:
+                M[indices[link], j] = 1 / len(links)
 
     # Initialize probability values
-    for page in pages:
-        pages_ranked[page] = 1/len(corpus)
+    ranks = np.full(N, 1 / N)
 
     while True:
-        # Initiliaze previous values dict
-        prev_pages_ranked = pages_ranked.copy()
-
-        # Update the values based on the fromula
-        for curr_page in pages:
-            Ssum = 0
-            for page in pages:
-                # Check if any page has no outgoing links, if so add one link for every page in pages
-                if len(corpus[page]) == 0:
-                    Ssum += pages_ranked[page] * 1/len(corpus)
-
-                elif curr_page in corpus[page]:
-                    Ssum += pages_ranked[page] / len(corpus[page])
-
-            formula = ((1 - damping_factor)/len(corpus) + (damping_factor * Ssum))
-            pages_ranked[curr_page] = formula
-
-        # Normalizing values
-        pg_sum = sum(pages_ranked.values())
-        for page, rank in pages_ranked.items():
-            pages_ranked[page] = rank / pg_sum
-
-        breakCondition = True
-        for page in pages:
-            if abs(pages_ranked[page] - prev_pages_ranked[page]) > 0.001:
-                breakCondition = False
-                break
-
-        if breakCondition:
-            return pages_ranked
+        # Update all the values based on the fromula at once
+        new_ranks = (1 - damping_factor) / N + damping_factor * (M @ ranks)
+
+        # The matrix is column-stochastic, so the ranks keep summing to 1
+        # and no per-iteration normalization is needed
+        if np.max(np.abs(new_ranks - ranks)) <= 0.001:
+            return dict(zip(pages, new_ranks))
+        ranks = new_ranks
         
         
 if __name__ == "__main__":
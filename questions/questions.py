@@ -1,12 +1,20 @@
+import heapq
 import nltk
 import sys
 import os
 import string
 import math
 
+from collections import Counter
+
 FILE_MATCHES = 1
 SENTENCE_MATCHES = 1
 
+# Load the stopword list once and precompile a punctuation-stripping
+# table, instead of rebuilding both for every word in tokenize
+STOPWORDS = frozenset(nltk.corpus.stopwords.words("english"))
+PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
 
 def main():
 
@@ -22,11 +30,17 @@ def main():
     }
     file_idfs = compute_idfs(file_words)
 
+    # Term frequencies per file, computed once up front
+    file_tf = {
+        filename: Counter(words)
+        for filename, words in file_words.items()
+    }
+
     # Prompt user for query
     query = set(tokenize(input("Query: ")))
 
     # Determine top file matches according to TF-IDF
-    filenames = top_files(query, file_words, file_idfs, n=FILE_MATCHES)
+    filenames = top_files(query, file_tf, file_idfs, n=FILE_MATCHES)
 
     # Extract sentences from top files
     sentences = dict()
@@ -74,18 +88,12 @@ def tokenize(document):
     Process document by coverting all words to lowercase, and removing any
     punctuation or English stopwords.
     """
-    words = []
-
-    for word in nltk.word_tokenize(document.lower()):
-        if word in nltk.corpus.stopwords.words("english"):
-            continue
-        
-        for char in word:
-            if char not in string.punctuation:
-                words.append(word)
-                break
-            
-    return words
+    # Keep words that are not stopwords and contain at least one
+    # non-punctuation character
+    return [
+        word for word in nltk.word_tokenize(document.lower())
+        if word not in STOPWORDS and word.translate(PUNCT_TABLE)
+    ]
 
 
 def compute_idfs(documents):
@@ -96,57 +104,37 @@ def compute_idfs(documents):
     Any word that appears in at least one of the documents should be in the
     resulting dictionary.
     """
-    idf_map = {}
     num_docs = len(documents)
-    
-    # Get NumDocumentsContaining(word) map
+
+    # Get NumDocumentsContaining(word) counts with a C-level update
+    counts = Counter()
     for doc_words in documents.values():
-        unique_words = set(doc_words)
-        for word in unique_words:
-            if word in idf_map:
-                idf_map[word] += 1
-            else:
-                idf_map[word] = 1
+        counts.update(set(doc_words))
 
     # Calculate idf values and add them to the map
-    for word in idf_map.keys():
-        idf_map[word] = math.log(num_docs/idf_map[word])
-
-    return idf_map
+    return {
+        word: math.log(num_docs / count)
+        for word, count in counts.items()
+    }
 
 
 def top_files(query, files, idfs, n):
     """
     Given a `query` (a set of words), `files` (a dictionary mapping names of
-    files to a list of their words), and `idfs` (a dictionary mapping words
+    files to a Counter of their words), and `idfs` (a dictionary mapping words
     to their IDF values), return a list of the filenames of the the `n` top
     files that match the query, ranked according to tf-idf.
     """
     file_list = {}
 
-    # Loop though every file in files
-    for filename, file_words in files.items():
-        sum = 0
-        tf = {}
-        # Loop though current file's words to get tf values
-        for word in file_words:
-            if word in tf:
-                tf[word] += 1
-            else:
-                tf[word] = 1
-        # Loop though query's words to get td_idf sum for that file
-        for word in query:
-            if word not in tf:
-                continue
-            sum += tf[word] * idfs[word]
-
-        # Add filename to the dict with the calculated sum value
-        file_list[filename] = sum
+    # Loop though every file computing its tf-idf sum for the query
+    for filename, tf in files.items():
+        file_list[filename] = sum(
+            tf[word] * idfs[word] for word in query if word in idfs
+        )
 
-    # Sort and generate the ouput list
-    output_list = sorted(file_list, key=lambda x: file_list[x], reverse=True)
-
-    return output_list[:n]
+    # Pick the n best files without sorting the whole corpus
+    return heapq.nlargest(n, file_list, key=file_list.get)
 
 
 def top_sentences(query, sentences, idfs, n):
@@ -161,21 +149,15 @@ def top_sentences(query, sentences, idfs, n):
 
     # Loop through the all sentences
     for sentence_name, sentence_words in sentences.items():
-        sum = 0
-        qtd = 0
-        # Loop though words of current sentence
-        for word in query:
-            if word in sentence_words:
-                sum += idfs[word]
-                qtd += 1
-        
-        # Add sentence_name to the dict with the calculated sum and qtd values as a tuple
-        sentence_list[sentence_name] = (sum, qtd / len(sentence_words))
-
-    # Sort and generate the ouput list
-    output_list = sorted(sentence_list, key=lambda x: (sentence_list[x][0], sentence_list[x][1]), reverse=True)
-    
-    return output_list[:n]
+        # Query words appearing in the sentence, via set intersection
+        matched = query & set(sentence_words)
+        score = sum(idfs[word] for word in matched)
+
+        # Add sentence_name to the dict with the score and density tuple
+        sentence_list[sentence_name] = (score, len(matched) / len(sentence_words))
+
+    # Pick the n best sentences without sorting them all
+    return heapq.nlargest(n, sentence_list, key=sentence_list.get)
 
 
 if __name__ == "__main__":
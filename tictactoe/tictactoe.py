@@ -3,7 +3,10 @@ Tic Tac Toe Player
 """
 
 import math
-from copy import deepcopy
+import os
+import pickle
+
+from functools import lru_cache
 
 X = "X"
 O = "O"
@@ -11,6 +14,148 @@ EMPTY = None
 pInf = math.inf
 nInf = -math.inf
 
+# Bitboard encoding used by the minimax search: bits 0-8 hold X's cells
+# and bits 9-17 hold O's cells, with bit 3*i+j standing for cell (i, j)
+ALL_CELLS = 0b111111111
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,   # rows
+    0b001001001, 0b010010010, 0b100100100,   # columns
+    0b100010001, 0b001010100                 # diagonals
+)
+
+# Strong moves first — center, corners, then edges — so alpha-beta
+# finds cutoffs as early as possible
+MOVE_ORDER = (
+    (1, 1),
+    (0, 0), (0, 2), (2, 0), (2, 2),
+    (0, 1), (1, 0), (1, 2), (2, 1)
+)
+MOVE_ORDER_BITS = tuple(1 << (3 * i + j) for i, j in MOVE_ORDER)
+
+
+def build_symmetries():
+    """
+    Returns, for each of the 8 grid symmetries (rotations and
+    reflections), a 512-entry table mapping any 9-bit mask to its
+    transformed mask, plus the inverse index permutation used to map a
+    stored move back into the original board's frame.
+    """
+    perms = []
+    for rotations in range(4):
+        for mirrored in (False, True):
+            perm = []
+            for i in range(3):
+                for j in range(3):
+                    r, c = (i, 2 - j) if mirrored else (i, j)
+                    for _ in range(rotations):
+                        r, c = c, 2 - r
+                    perm.append(3 * r + c)
+            perms.append(perm)
+
+    tables = []
+    inverses = []
+    for perm in perms:
+        table = [0] * 512
+        for mask in range(512):
+            image = 0
+            for k in range(9):
+                if mask >> k & 1:
+                    image |= 1 << perm[k]
+            table[mask] = image
+        tables.append(tuple(table))
+        inverses.append(tuple(perm.index(m) for m in range(9)))
+    return tuple(tables), tuple(inverses)
+
+
+SYMMETRY_TABLES, SYMMETRY_INVERSES = build_symmetries()
+
+
+def canonical(state):
+    """
+    Returns (canonical state, symmetry index): the smallest packed state
+    among the 8 symmetric images of `state`, and which symmetry
+    produced it.
+    """
+    x_mask = state & ALL_CELLS
+    o_mask = state >> 9
+    best = state
+    best_sym = 0
+    for sym, table in enumerate(SYMMETRY_TABLES):
+        image = table[x_mask] | (table[o_mask] << 9)
+        if image < best:
+            best = image
+            best_sym = sym
+    return best, best_sym
+
+
+def pack(board):
+    """
+    Packs a list-of-lists board into a single bitboard int.
+    """
+    state = 0
+    for i in range(3):
+        for j in range(3):
+            cell = board[i][j]
+            if cell is X:
+                state |= 1 << (3 * i + j)
+            elif cell is O:
+                state |= 1 << (3 * i + j + 9)
+    return state
+
+
+def empty_bits(state):
+    """
+    Returns the bitmask of empty cells in a packed state.
+    """
+    return ~((state & ALL_CELLS) | (state >> 9)) & ALL_CELLS
+
+
+def winner_bits(state):
+    """
+    Returns the winner on a packed state, if there is one.
+    """
+    x_mask = state & ALL_CELLS
+    o_mask = state >> 9
+    for mask in WIN_MASKS:
+        if x_mask & mask == mask:
+            return X
+        if o_mask & mask == mask:
+            return O
+    return None
+
+
+def evaluate_bits(state):
+    """
+    Returns (is_terminal, utility) for a packed state in a single pass
+    over the win masks, so leaf nodes don't scan the lines three times
+    for terminal, winner and utility separately.
+    """
+    x_mask = state & ALL_CELLS
+    o_mask = state >> 9
+    for mask in WIN_MASKS:
+        if x_mask & mask == mask:
+            return True, 1
+        if o_mask & mask == mask:
+            return True, -1
+    if (x_mask | o_mask) == ALL_CELLS:
+        return True, 0
+    return False, 0
+
+
+def terminal_bits(state):
+    """
+    Returns True if a packed state is a finished game, False otherwise.
+    """
+    return evaluate_bits(state)[0]
+
+
+def utility_bits(state):
+    """
+    Returns 1 if X has won on a packed state, -1 if O has won, 0 otherwise.
+    """
+    return evaluate_bits(state)[1]
+
 
 def initial_state():
     """
@@ -30,9 +175,9 @@ def player(board):
     o_count = 0
     for i in board:
         for j in i:
-            if j == X:
+            if j is X:
                 x_count += 1
-            if j == O:
+            if j is O:
                 o_count += 1
         
     if terminal(board):
@@ -45,53 +190,36 @@ def player(board):
 
 def actions(board):
     """
-    Returns set of all possible actions (i, j) available on the board.
+    Returns a list of all possible actions (i, j) available on the board.
     """
     if terminal(board):
         return "Game Over"
-    
-    explored = set()
-    for row_idx, i in enumerate(board):
-        for col_idx, j in enumerate(i):
-            if j == EMPTY:
-                explored.add((row_idx, col_idx))
-    return explored
-    
+
+    # Callers only iterate the actions once, so a plain list avoids
+    # hashing every move into a set
+    return [
+        (i, j) for i, j in MOVE_ORDER if board[i][j] is EMPTY
+    ]
+
 
 def result(board, action):
     """
     Returns the board that results from making move (i, j) on the board.
     """
-    if action not in actions(board):
+    i, j = action
+    if board[i][j] is not EMPTY:
         raise ValueError("Action not valid.")
-    
-    new_board = deepcopy(board)
-    for row_idx, i in enumerate(board):
-        for col_idx, j in enumerate(board):
-            if action == (row_idx, col_idx):
-                new_board[row_idx][col_idx] = player(new_board)
+
+    new_board = [row[:] for row in board]
+    new_board[i][j] = player(board)
     return new_board
 
 
 def winner(board):
     """
     Returns the winner of the game, if there is one.
-    """    
-    for i in range(3):
-        for j in range(3):
-            if j == 0:
-                if board[i][j] == board[i][j+1] == board[i][j+2] != None:
-                    return board[i][j]
-            if i == 0:
-                if board[i][j] == board[i+1][j] == board[i+2][j] != None:
-                    return board[i][j]
-            if j == 0 and i == 0:
-                if board[i][j] == board[i+1][j+1] == board[i+2][j+2] != None:
-                    return board[i][j]
-            if j == 0 and i == 2:
-                if board[i][j] == board[i-1][j+1] == board[i-2][j+2] != None:
-                    return board[i][j]   
-    return None
+    """
+    return winner_bits(pack(board))
 
 
 def terminal(board):
@@ -107,54 +235,121 @@ def utility(board):
     """
     Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
     """
-    if winner(board) == X:
+    if winner(board) is X:
         return 1
-    if winner(board) == O:
+    if winner(board) is O:
         return -1
-    if winner(board) == None:
+    if winner(board) is None:
         return 0
 
+@lru_cache(maxsize=None)
+def max_value(state, alpha, beta):
+    """
+    Returns the value of a packed state with X to move, pruning branches
+    that cannot beat `beta` and memoizing each searched position.
+    """
+    done, u = evaluate_bits(state)
+    if done:
+        return u
+    v = nInf
+    bits = empty_bits(state)
+    for b in MOVE_ORDER_BITS:
+        if bits & b:
+            v = max(v, min_value(canonical(state | b)[0], alpha, beta))
+            if v >= beta:
+                return v
+            alpha = max(alpha, v)
+    return v
+
+
+@lru_cache(maxsize=None)
+def min_value(state, alpha, beta):
+    """
+    Returns the value of a packed state with O to move, pruning branches
+    that cannot fall below `alpha` and memoizing each searched position.
+    """
+    done, u = evaluate_bits(state)
+    if done:
+        return u
+    v = pInf
+    bits = empty_bits(state)
+    for b in MOVE_ORDER_BITS:
+        if bits & b:
+            v = min(v, max_value(canonical(state | (b << 9))[0], alpha, beta))
+            if v <= alpha:
+                return v
+            beta = min(beta, v)
+    return v
+
+
+def build_policy():
+    """
+    Returns a dict mapping every reachable non-terminal canonical state
+    to its optimal move bit, computed once with the bitboard search.
+    States equivalent under symmetry share a single entry.
+    """
+    policy = {}
+
+    def explore(state, x_to_move):
+        if state in policy or terminal_bits(state):
+            return
+
+        optimal_bit = None
+        v = nInf if x_to_move else pInf
+        bits = empty_bits(state)
+        while bits:
+            b = bits & -bits
+            if x_to_move:
+                child = canonical(state | b)[0]
+                new_v = min_value(child, nInf, pInf)
+                if optimal_bit is None or new_v > v:
+                    v = new_v
+                    optimal_bit = b
+            else:
+                child = canonical(state | (b << 9))[0]
+                new_v = max_value(child, nInf, pInf)
+                if optimal_bit is None or new_v < v:
+                    v = new_v
+                    optimal_bit = b
+            explore(child, not x_to_move)
+            bits ^= b
+
+        policy[state] = optimal_bit
+
+    # X always moves first from the empty board
+    explore(0, True)
+    return policy
+
+
 def minimax(board):
     """
     Returns the optimal action for the current player on the board.
     """
-    optimal_move = None
-
     if terminal(board) == True:
         return None
 
-    def max_value(board):
-        if terminal(board):
-            return utility(board)
-        v = nInf
-        for action in actions(board):
-            v = max(v, min_value(result(board, action)))
-        return v
-    
-    
-    def min_value(board):
-        if terminal(board):
-            return utility(board)
-        v = pInf
-        for action in actions(board):
-            v = min(v, max_value(result(board, action)))
-        return v
-    
-    if player(board) == X:
-        v = nInf
-        for action in actions(board):
-            new_v = min_value(result(board, action))
-            if new_v > v:
-                v = new_v
-                optimal_move = action
-    else:
-        v = pInf
-        for action in actions(board):
-            new_v = max_value(result(board, action))
-            if new_v < v:
-                v = new_v
-                optimal_move = action
-
-    return optimal_move
-    
-    
+    # Every reachable position's best move is precomputed for its
+    # canonical image, so serving a move is a single dict lookup
+    state, sym = canonical(pack(board))
+    b = POLICY.get(state)
+    if b is None:
+        return None
+
+    # Map the stored move from the canonical frame back to this board
+    return divmod(SYMMETRY_INVERSES[sym][b.bit_length() - 1], 3)
+
+
+# Load the precomputed policy table, or build and save it on first run
+POLICY_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tictactoe_policy.pkl"
+)
+try:
+    with open(POLICY_FILE, "rb") as f:
+        POLICY = pickle.load(f)
+except (OSError, EOFError, pickle.UnpicklingError):
+    POLICY = build_policy()
+    try:
+        with open(POLICY_FILE, "wb") as f:
+            pickle.dump(POLICY, f)
+    except OSError:
+        pass